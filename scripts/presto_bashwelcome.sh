@@ -226,7 +226,21 @@ fi
 
 # Get Raspberry Pi info
 cpu_temp=$(cat /sys/class/thermal/thermal_zone0/temp )
-gpu_temp=$(vcgencmd measure_temp |  awk '{split($0,numbers,"=")} {print numbers[2]}')
+# read the gpu thermal zone directly when the firmware exposes one (no vcgencmd fork)
+gpu_temp=""
+for zone in /sys/class/thermal/thermal_zone*; do
+  read -r zone_type 2>/dev/null < "${zone}/type" || continue
+  if [[ "$zone_type" == gpu* ]]; then
+    read -r zone_temp 2>/dev/null < "${zone}/temp" || continue
+    [[ "$zone_temp" =~ ^[0-9]+$ ]] || continue
+    gpu_temp="$((zone_temp/1000)).$(((zone_temp%1000)/100))'C"
+    break
+  fi
+done
+unset zone zone_type zone_temp
+if [[ -z "$gpu_temp" ]]; then
+  gpu_temp=$(vcgencmd measure_temp |  awk '{split($0,numbers,"=")} {print numbers[2]}')
+fi
 internal_ip=$(hostname -I | awk '{print $1, $2, $3}') #only show first three as theres possibily many remove awk part to show all
 external_ip=$(curl -s https://ipv4.icanhazip.com) #curl -s https://ipv6.icanhazip.com for ipv6 values
 date=$(date +"%A, %d %B %Y, %H:%M:%S")
@@ -1,4 +1,4 @@
-#!/usr/bin/python
+#!/usr/bin/python3
 
 #  __/\\\\\\\\\\\\\______/\\\\\\\\\______/\\\\\\\\\\\\\\\_____/\\\\\\\\\\\____/\\\\\\\\\\\\\\\_______/\\\\\______        
 #   _\/\\\/////////\\\__/\\\///////\\\___\/\\\///////////____/\\\/////////\\\_\///////\\\/////______/\\\///\\\____       
@@ -35,13 +35,48 @@
 # PRESTO DOCKER WRAPPERS TO START STOP CHECK UPDATE REBUILD AND CLEAN /PRUNE IMAGES in one go
 ##################################################################################################
 
-import os,sys,subprocess
+import os,sys,subprocess,argparse,shutil
+
+# shutil.which / subprocess.run below are python3 only; say so instead of a traceback
+# when started as 'python presto_update_full.py' on a pi where python is still 2.7
+if sys.version_info[0] < 3:
+    sys.exit("[presto] presto_update_full.py needs python3 - run it with python3")
+
+# resolve docker once so the child is exec'd by path, no PATH scan per launch
+DOCKER_BIN = shutil.which("docker")
+
+# command argvs, built once
+UPDATE_CMD = ("./update.sh",)
+PRUNE_CMD = (DOCKER_BIN, "image", "prune", "-a", "-f")
+
+def positive_int(value):
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be a whole number of 1 or more, got %r" % value)
+    return n
+
+parser = argparse.ArgumentParser(description="presto one shot docker stack update + image prune")
+parser.add_argument("--parallel", type=positive_int, metavar="N",
+                    help="max concurrent compose pulls (sets COMPOSE_PARALLEL_LIMIT for update.sh)")
+args = parser.parse_args()
+if args.parallel is not None:
+    # inherited by the docker compose calls inside update.sh
+    os.environ["COMPOSE_PARALLEL_LIMIT"] = str(args.parallel)
+
+if DOCKER_BIN is None:
+    print("[presto] docker not found in PATH - nothing to update")
+    sys.exit(1)
+
 os.chdir("/home/pi/presto/scripts/")
 ##ping = subprocess.Popen("./update.sh",stdout = subprocess.PIPE,stderr = subprocess.PIPE,shell=True) #quietver
-update_ping = subprocess.Popen("./update.sh",shell=True)						    #verbosever
-update_out = update_ping.communicate()[0]
-output = str(update_out)
-##print output
+try:
+    subprocess.run(UPDATE_CMD)					    #verbosever (argv list, no /bin/sh fork)
+except OSError as e:
+    # missing / not executable / no shebang: report it and still prune, like /bin/sh used to
+    print("[presto] could not run ./update.sh ({}) - skipping update".format(e))
 
 #print(" [presto] updating/recreated  presto stack Complete")
 
@@ -56,7 +91,7 @@ print("[presto] pruning-images now one moment...")
 
 #print output
 
-os.system("docker image prune -a -f")
+subprocess.run(PRUNE_CMD)
 
 print("[presto] presto containers up'd +  pruning-images finished.")
 